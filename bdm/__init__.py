@@ -1,3 +1,6 @@
+"""PyBDM: block decomposition method."""
+from .bdm import BDM
+
 __author__ = 'Szymon Talaga'
 __email__ = 'stalaga@protonmail.com'
 __version__ = '0.0.0'
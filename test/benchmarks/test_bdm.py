@@ -1,9 +1,82 @@
-"""Benchmarks for `bdm` module."""
+"""Benchmarks for `bdm` module.
+
+Throughput and peak memory of `BDM` are compared against the reference
+implementation in ``_ref/``. Every combination of matrix kind and shape
+is a separate benchmark group, so both implementations are reported
+side by side. Peak memory usage (in bytes) of both implementations
+and speedup of `BDM` are stored in ``extra_info``
+(see ``--benchmark-json`` option). Speedup is computed from timings of single
+calls of both implementations measured with the same settings.
+`BDM` benchmarks are run only if their results agree with the reference.
+"""
+import io
+import timeit
+import tracemalloc
+from contextlib import redirect_stdout
 import pytest
 
-def some_function():
-    pass
 
-@pytest.mark.benchmark(min_rounds=30)
-def test_benchmark_some_function(benchmark):
-    benchmark(some_function)
+KINDS = ['random', 'tiles']
+SHAPES = [
+    (8, 8), (32, 32), (100, 100),
+    pytest.param((256, 256), marks=pytest.mark.slow),
+    pytest.param((512, 512), marks=pytest.mark.slow),
+    pytest.param((1000, 1000), marks=pytest.mark.slow)
+]
+
+
+def peak_memory(func, *args, **kwds):
+    """Get peak memory allocated during a function call (in bytes)."""
+    tracemalloc.start()
+    try:
+        func(*args, **kwds)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def best_time(func, *args, repeat=5, **kwds):
+    """Get the best time (in seconds) of a function call."""
+    times = timeit.repeat(lambda: func(*args, **kwds),
+                          number=1, repeat=repeat)
+    return min(times)
+
+
+@pytest.fixture(scope='module')
+def ref_bdm(ref):
+    """Fixture: reference BDM function with silenced standard output."""
+    def calculate_bdm(string, lookup):
+        with redirect_stdout(io.StringIO()):
+            return ref.calculate_bdm(string, lookup)
+    return calculate_bdm
+
+
+@pytest.mark.benchmark(min_rounds=5)
+@pytest.mark.parametrize('shape', SHAPES)
+@pytest.mark.parametrize('kind', KINDS)
+def test_benchmark_ref(benchmark, ref_bdm, ref_lookup,
+                       make_matrix, to_ref_string, kind, shape):
+    benchmark.group = '{}-{}x{}'.format(kind, *shape)
+    string = to_ref_string(make_matrix(kind, shape, seed=1010))
+    benchmark.extra_info['peak_memory'] = \
+        peak_memory(ref_bdm, string, ref_lookup)
+    benchmark(ref_bdm, string, ref_lookup)
+
+@pytest.mark.xfail(strict=True, raises=AssertionError,
+                   reason="default BDM pipeline not implemented")
+@pytest.mark.benchmark(min_rounds=5)
+@pytest.mark.parametrize('shape', SHAPES)
+@pytest.mark.parametrize('kind', KINDS)
+def test_benchmark_bdm(benchmark, bdm_matrix, ref_bdm, ref_lookup,
+                       make_matrix, to_ref_string, kind, shape):
+    benchmark.group = '{}-{}x{}'.format(kind, *shape)
+    X = make_matrix(kind, shape, seed=1010)
+    string = to_ref_string(X)
+    output = bdm_matrix.complexity(X)
+    assert output == pytest.approx(ref_bdm(string, ref_lookup))
+    benchmark.extra_info['peak_memory'] = \
+        peak_memory(bdm_matrix.complexity, X)
+    benchmark.extra_info['speedup'] = \
+        best_time(ref_bdm, string, ref_lookup) / \
+        best_time(bdm_matrix.complexity, X)
+    benchmark(bdm_matrix.complexity, X)
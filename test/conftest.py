@@ -1,5 +1,12 @@
 """*PyTest* configuration and general purpose fixtures."""
+import os
+import importlib.util
+import numpy as np
 import pytest
+from bdm import BDM
+
+
+_REF_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), '_ref')
 
 
 def pytest_addoption(parser):
@@ -13,6 +20,12 @@ def pytest_addoption(parser):
         help="Run slow tests / benchmarks."""
     )
 
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        'markers', "slow: slow tests / benchmarks (run only with --slow)."
+    )
+
 def pytest_collection_modifyitems(config, items):
     """Modify test runner behaviour based on `pytest` settings."""
     run_benchmarks = config.getoption('--benchmarks')
@@ -34,3 +47,77 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if 'slow' in item.keywords:
                 item.add_marker(skip_slow)
+
+
+def _make_matrix(kind, shape, seed=None):
+    """Generate binary matrix of a given kind.
+
+    Parameters
+    ----------
+    kind : {'random', 'zeros', 'ones', 'checkerboard', 'stripes', 'tiles'}
+        Type of a matrix. Random matrices are i.i.d. Bernoulli(0.5),
+        ``tiles`` is a random 4 x 4 block repeated over the whole matrix
+        and all other kinds are deterministic patterns.
+    shape : tuple of int
+        Shape of a matrix.
+    seed : int or None
+        Seed of a random number generator.
+    """
+    rng = np.random.RandomState(seed)
+    nrows, ncols = shape
+    if kind == 'random':
+        X = rng.randint(0, 2, shape)
+    elif kind == 'zeros':
+        X = np.zeros(shape, dtype=int)
+    elif kind == 'ones':
+        X = np.ones(shape, dtype=int)
+    elif kind == 'checkerboard':
+        X = np.add.outer(np.arange(nrows), np.arange(ncols)) % 2
+    elif kind == 'stripes':
+        X = np.tile(np.arange(ncols) % 2, (nrows, 1))
+    elif kind == 'tiles':
+        block = rng.randint(0, 2, (4, 4))
+        X = np.tile(block, (nrows // 4 + 1, ncols // 4 + 1))[:nrows, :ncols]
+    else:
+        raise ValueError("Unknown matrix kind '{}'".format(kind))
+    return X.astype(int)
+
+def _to_ref_string(X):
+    """Convert binary matrix to the string format of the reference code."""
+    return '-'.join(''.join(str(x) for x in row) for row in X)
+
+
+@pytest.fixture(scope='session')
+def make_matrix():
+    """Fixture: binary matrix generator."""
+    return _make_matrix
+
+@pytest.fixture(scope='session')
+def to_ref_string():
+    """Fixture: matrix to reference string format converter."""
+    return _to_ref_string
+
+@pytest.fixture(scope='session')
+def ref():
+    """Fixture: reference implementation module (``_ref/BDM.py``)."""
+    spec = importlib.util.spec_from_file_location(
+        '_ref_bdm', os.path.join(_REF_DIR, 'BDM.py')
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture(scope='session')
+def ref_lookup(ref):
+    """Fixture: reference lookup table of CTM values for 4 x 4 matrices."""
+    return ref.build_lookup_table(os.path.join(_REF_DIR, 'D5.CSV'))
+
+@pytest.fixture(scope='session')
+def ref_input(ref):
+    """Fixture: example matrices of the reference code (``_ref/input.txt``)."""
+    return ref.import_stringlist(os.path.join(_REF_DIR, 'input.txt'))
+
+@pytest.fixture(scope='session')
+def bdm_matrix():
+    """Fixture: BDM object for matrices."""
+    return BDM(dtype='matrix')
@@ -3,6 +3,22 @@ import pytest
 from bdm import BDM
 
 
+KINDS = ['random', 'zeros', 'ones', 'checkerboard', 'stripes', 'tiles']
+SHAPES = [
+    (4, 4), (8, 8), (10, 10), (12, 20), (16, 16), (30, 30), (32, 32),
+    pytest.param((64, 64), marks=pytest.mark.slow),
+    pytest.param((100, 100), marks=pytest.mark.slow),
+    pytest.param((256, 256), marks=pytest.mark.slow),
+    pytest.param((512, 512), marks=pytest.mark.slow)
+]
+REF_VALUES = [
+    56.3596, 54.6290, 56.3596, 50.7376, 924.8364, 908.5508,
+    911.5279, 1082.3282, 902.6095, 886.6153, 916.4868, 923.9377,
+    762.0790, 925.6601, 930.4993, 887.3998, 759.3958, 1096.1699,
+    757.2888, 772.9872, 926.3526, 919.2898, 744.3619, 754.5082
+]
+
+
 @pytest.fixture(scope='module')
 def bdmobj():
     """Fixture: BDM object for testing."""
@@ -22,3 +38,24 @@ class TestBDM:
 
     def test_complexity(self, bdmobj):
         pass
+
+
+@pytest.mark.parametrize('idx,expected', list(enumerate(REF_VALUES)))
+def test_ref_complexity(ref, ref_lookup, ref_input, idx, expected):
+    output = ref.calculate_bdm(ref_input[idx], ref_lookup)
+    assert output == pytest.approx(expected)
+
+
+@pytest.mark.xfail(strict=True, raises=AssertionError,
+                   reason="default BDM pipeline not implemented")
+class TestReference:
+    """Equivalence of `BDM` and the reference implementation in ``_ref/``."""
+
+    @pytest.mark.parametrize('shape', SHAPES)
+    @pytest.mark.parametrize('kind', KINDS)
+    def test_complexity(self, bdm_matrix, ref, ref_lookup,
+                        make_matrix, to_ref_string, kind, shape):
+        X = make_matrix(kind, shape, seed=1010)
+        expected = ref.calculate_bdm(to_ref_string(X), ref_lookup)
+        output = bdm_matrix.complexity(X)
+        assert output == pytest.approx(expected)